@@ -0,0 +1,17 @@
+# article_parser.py
+#
+# CPU-bound HTML parsing run in worker processes by web_researcher. This module
+# must stay free of import-time side effects: forkserver workers import it to
+# unpickle the task.
+
+from lxml import html as lxml_html
+from readability import Document
+
+
+def extract_from_page_source(html: str) -> str:
+    """Run readability-lxml over already-fetched HTML and return its main text."""
+    summary_html = Document(html).summary()
+    # text_content() would run adjacent block elements together, so join the text
+    # nodes line by line instead, as get_text(separator="\n") did.
+    root = lxml_html.fromstring(summary_html)
+    return "\n".join(text.strip() for text in root.itertext() if text.strip())
@@ -1,6 +1,6 @@
 # models.py
 
-from typing import List, Optional
+from typing import List, Literal, Optional
 from pydantic import BaseModel, Field
 
 
@@ -90,41 +90,60 @@ class ConfirmResponse(BaseModel):
     evidence: Optional[List[str]] = None
 
 
+class NameCheck(BaseModel):
+    name: str
+    answer: str  # "yes" or "no"
+
+
+class NameConfirmationResponse(BaseModel):
+    names: List[NameCheck]
+
+
 class SuspectFormResponse(BaseModel):
     name: str  # The suspect's name
-    gender: Optional[str] = None
-    date_of_birth: Optional[str] = None  # "YYYY-MM-DD" or null
+    gender: Optional[Literal["male", "female"]] = None
+    date_of_birth: Optional[str] = Field(None, description="Date of birth as YYYY-MM-DD")
     age: Optional[int] = None
     address_notes: Optional[str] = None
     phone_number: Optional[str] = None
     nationality: Optional[str] = None
     occupation: Optional[str] = None
-    role: Optional[str] = None
-    appearance: Optional[str] = None
-    vehicle_description: Optional[str] = None
-    vehicle_plate_number: Optional[str] = None
-    evidence: Optional[str] = None
-    arrested_status: Optional[str] = None
-    arrest_date: Optional[str] = None   # "YYYY-MM-DD" or null
-    crimes_person_charged_with: Optional[str] = None
-    willing_pv_names: Optional[str] = None
-    suspect_in_police_custody: Optional[str] = None
-    suspect_current_location: Optional[str] = None
-    suspect_last_known_location: Optional[str] = None
-    suspect_last_known_location_date: Optional[str] = None  # "YYYY-MM-DD" or null
+    role: Optional[str] = Field(None, description="The suspect's role in the crime")
+    appearance: Optional[str] = Field(None, description="The suspect's appearance")
+    vehicle_description: Optional[str] = Field(None, description="Description of the suspect's vehicle")
+    vehicle_plate_number: Optional[str] = Field(None, description="The vehicle's plate number")
+    evidence: Optional[str] = Field(None, description="What is evident of the suspect from the article")
+    arrested_status: Optional[str] = Field(None, description="Whether the suspect has been arrested")
+    arrest_date: Optional[str] = Field(None, description="Date of arrest as YYYY-MM-DD")
+    crimes_person_charged_with: Optional[str] = Field(None, description="Crime(s) the person is charged with")
+    willing_pv_names: Optional[str] = Field(
+        None, description="Names of potential victims (PVs) willing to testify against the suspect"
+    )
+    suspect_in_police_custody: Optional[str] = Field(None, description="Whether the suspect is in police custody")
+    suspect_current_location: Optional[str] = Field(None, description="The suspect's current location")
+    suspect_last_known_location: Optional[str] = Field(None, description="The suspect's last known location")
+    suspect_last_known_location_date: Optional[str] = Field(
+        None, description="Date of the suspect's last known location as YYYY-MM-DD"
+    )
 
 class VictimFormResponse(BaseModel):
-    name: str  # The suspect's name
-    gender: Optional[str] = None
-    date_of_birth: Optional[str] = None  # "YYYY-MM-DD" or null
+    name: str  # The victim's name
+    gender: Optional[Literal["male", "female"]] = None
+    date_of_birth: Optional[str] = Field(None, description="Date of birth as YYYY-MM-DD")
     age: Optional[int] = None
     address_notes: Optional[str] = None
     phone_number: Optional[str] = None
     nationality: Optional[str] = None
     occupation: Optional[str] = None
-    appearance: Optional[str] = None
-    vehicle_description: Optional[str] = None
-    vehicle_plate_number: Optional[str] = None
-    destination: Optional[str] = None
-    job_offered: Optional[str] = None
-
+    appearance: Optional[str] = Field(None, description="The victim's appearance")
+    vehicle_description: Optional[str] = Field(None, description="Description of the victim's vehicle")
+    vehicle_plate_number: Optional[str] = Field(None, description="The vehicle's plate number")
+    destination: Optional[str] = Field(None, description="Where the victim has been trafficked to")
+    job_offered: Optional[str] = Field(None, description="What job the victim has been offered")
+
+
+class FullExtractionResponse(BaseModel):
+    incident: IncidentResponse
+    # Required (no defaults) so the schema is accepted by strict structured outputs.
+    suspects: List[SuspectFormResponse]
+    victims: List[VictimFormResponse]
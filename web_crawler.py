@@ -8,17 +8,31 @@ Usage:
 Developer: Christo Strydom
 """
 
+import asyncio
+import atexit
 import csv
 import argparse
+import functools
+import itertools
 import logging
+import logging.handlers
+import queue
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import List
-from urllib.parse import urlparse
+from typing import AsyncIterator, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+import aiohttp
 import tldextract
-from googlesearch import search  # Ensure you are using the correct googlesearch package.
+from bs4 import BeautifulSoup
 import json
 import os
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to the stdlib parser.
+    _json_loads = json.loads
+
 from libraries.neo4j_lib import execute_neo4j_query
 
 # ------------------------------
@@ -26,27 +40,209 @@ from libraries.neo4j_lib import execute_neo4j_query
 # ------------------------------
 def load_config(config_path: str) -> dict:
     """
-    Load configuration from a JSON file.
+    Load configuration from a JSON file, caching the result per absolute path.
     """
-    full_path = os.path.join(os.getcwd(), config_path)
-    if not os.path.exists(full_path):
-        raise FileNotFoundError(f"Configuration file not found: {full_path}")
+    return _load_config(os.path.abspath(config_path))
+
+
+@functools.lru_cache(maxsize=None)
+def _load_config(full_path: str) -> dict:
     try:
-        with open(full_path, "r") as f:
-            return json.load(f)
+        with open(full_path, "rb") as f:
+            return _json_loads(f.read())
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Configuration file not found: {full_path}")
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so this covers both parsers.
     except json.JSONDecodeError as e:
         raise json.JSONDecodeError(f"Invalid JSON in config file: {str(e)}", e.doc, e.pos)
 
-config = load_config("search_config.json")
 
-logging.basicConfig(
-    filename="web_crawler.log",
-    filemode="a",
-    format="%(asctime)s - %(levelname)s - %(message)s",
-    level=logging.INFO,
-)
+# Records are handed to a queue and written to disk by a listener thread, so
+# logging never blocks the event loop on file I/O.
+_log_queue: queue.Queue = queue.Queue(-1)
+_file_handler = logging.FileHandler("web_crawler.log", mode="a")
+_file_handler.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
+_log_listener = logging.handlers.QueueListener(_log_queue, _file_handler)
+# The queue handler only merges args into the message; the file handler applies
+# the real format, so records are not formatted twice.
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter("%(message)s"))
+logging.basicConfig(handlers=[_queue_handler], level=logging.INFO)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
-logger.info("Google Miner service started (refactored, sync version).")
+logger.info("Google Miner service started (refactored, async version).")
+
+# Shared extractor using the bundled public suffix list snapshot, so lookups never
+# refresh the list over the network or touch the on-disk cache.
+_TLD = tldextract.TLDExtract(suffix_list_urls=(), cache_dir=None)
+
+
+GOOGLE_SEARCH_URL = "https://www.google.com/search"
+RESULTS_PER_PAGE = 10
+PAGE_BATCH_SIZE = 4
+MAX_CONCURRENT_REQUESTS = 5
+REQUESTS_PER_SECOND = 0.5
+MAX_RETRIES = 3
+RETRY_BASE_DELAY = 2.0
+RETRY_MAX_DELAY = 30.0
+RETRYABLE_STATUSES = (429, 503)
+NEO4J_BATCH_SIZE = 1000
+CSV_CHUNK_SIZE = 10_000
+SINK_BATCH_SIZE = 100
+SINK_QUEUE_SIZE = 16
+EXECUTOR_MAX_WORKERS = 32
+DNS_CACHE_TTL = 300
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/90.0.4430.85 Safari/537.36"
+)
+
+
+class CSVSink:
+    """
+    Writes one search's articles to CSV, rotating to a new ``_partNNN`` file every
+    ``chunk_size`` rows so no single file grows without bound.
+
+    Files are only created once the first row is written. Not thread-safe: rows
+    for a given sink must be written by one caller at a time.
+    """
+    fieldnames = ["url", "domain_name", "source"]
+
+    def __init__(
+        self,
+        search_name: str,
+        chunk_size: int = CSV_CHUNK_SIZE,
+        output_dir: str = "output",
+        source: str = "google_miner",
+    ) -> None:
+        self.search_name = search_name
+        self.source = source
+        self.chunk_size = chunk_size
+        self.output_dir = output_dir
+        self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.count = 0
+        self.part = 0
+        self._rows_in_part = 0
+        self._file = None
+        self._file_name = None
+        self._writer = None
+
+    def _rotate(self) -> None:
+        self._close_file()
+        self.part += 1
+        self._rows_in_part = 0
+        os.makedirs(self.output_dir, exist_ok=True)
+        self._file_name = (
+            f"{self.output_dir}/saved_urls_{self.search_name}_{self.timestamp}_part{self.part:03d}.csv"
+        )
+        self._file = open(self._file_name, mode="w", newline="", encoding="utf-8", buffering=1 << 20)
+        self._writer = csv.DictWriter(self._file, fieldnames=self.fieldnames)
+        self._writer.writeheader()
+
+    def _close_file(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            logger.info(f"CSV file '{self._file_name}' created successfully.")
+
+    def write(self, urls: Iterable[Tuple[str, str]]) -> None:
+        """
+        Append (url, domain_name) rows, starting a new part file whenever the current one is full.
+        """
+        rows = iter(urls)
+        while True:
+            # Fill the current part in one writerows call, rotating only between slices.
+            if self._file is not None and self._rows_in_part < self.chunk_size:
+                batch = list(itertools.islice(rows, self.chunk_size - self._rows_in_part))
+            else:
+                batch = list(itertools.islice(rows, self.chunk_size))
+                if batch:
+                    self._rotate()
+            if not batch:
+                return
+            self._writer.writerows(
+                {"url": url, "domain_name": domain_name, "source": self.source} for url, domain_name in batch
+            )
+            self._rows_in_part += len(batch)
+            self.count += len(batch)
+
+    def close(self) -> None:
+        """
+        Close the current part file, if any.
+        """
+        self._close_file()
+        if self.part:
+            logger.info(f"Saved {self.count} URLs to CSV across {self.part} file(s).")
+
+
+class RateLimiter:
+    """
+    Bounds concurrent requests and spaces their start times to a fixed rate.
+
+    A single instance is shared by every searcher so that the limits apply to
+    the process as a whole rather than per configuration.
+    """
+    def __init__(self, max_concurrent: int = MAX_CONCURRENT_REQUESTS, rps: float = REQUESTS_PER_SECOND) -> None:
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._lock = asyncio.Lock()
+        self.min_interval = 1.0 / rps
+        self._last_call = 0.0
+
+    async def __aenter__(self) -> "RateLimiter":
+        await self._semaphore.acquire()
+        try:
+            async with self._lock:
+                loop = asyncio.get_running_loop()
+                wait = self._last_call + self.min_interval - loop.time()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                self._last_call = loop.time()
+        except BaseException:
+            self._semaphore.release()
+            raise
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        self._semaphore.release()
+
+
+def _netloc(url: str) -> str:
+    """
+    Return the lowercased host of a URL, without userinfo or port, without building
+    a full urlparse result.
+    """
+    start = url.find("://")
+    start = start + 3 if start >= 0 else 0
+    end = len(url)
+    for sep in "/?#":
+        i = url.find(sep, start, end)
+        if i >= 0:
+            end = i
+    host = url[start:end].rpartition("@")[2]
+    if host.startswith("["):  # IPv6 literal; its colons are not a port separator.
+        return host[:host.find("]") + 1].lower()
+    return host.partition(":")[0].lower()
+
+
+def parse_result_links(html: str) -> List[str]:
+    """
+    Extract the organic result URLs from a Google results page.
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    links = []
+    for anchor in soup.find_all("a", href=True):
+        href = anchor["href"]
+        # Result links are wrapped as /url?q=<target>&... by Google.
+        if href.startswith("/url?"):
+            href = parse_qs(urlparse(href).query).get("q", [""])[0]
+        if not href.startswith(("http://", "https://")):
+            continue
+        if "google." in urlparse(href).netloc:
+            continue
+        links.append(href)
+    return links
 
 
 # ------------------------------
@@ -56,11 +252,27 @@ class TraffickingNewsSearch:
     """
     Encapsulates news article search logic related to trafficking incidents.
     """
-    def __init__(self, search_config: dict) -> None:
+    def __init__(self, search_config: dict, rate_limiter: Optional[RateLimiter] = None) -> None:
+        self.rate_limiter = rate_limiter or RateLimiter()
         self.search_name = search_config.get('id', 'default_search')
         self.days_back = search_config.get('days_back', 7)
+        self.source = search_config.get('source', 'google_miner')
+        self.csv_sink = CSVSink(self.search_name, source=self.source)
+        # The Cypher text is constant per search; only the rows change between batches.
+        self._merge_cypher = """
+            UNWIND $rows AS row
+            MERGE (url:Url {url: row.url, source: $src})
+            WITH url, row
+            MERGE (domain:Domain { name: row.domain })
+            MERGE (url)-[:HAS_DOMAIN]->(domain)
+        """
+        self._merge_params_base = {"src": self.source}
         # Optional filtering: these can be provided via configuration; otherwise default to empty lists.
         self.excluded_domains = search_config.get('excluded_domains', [])
+        # Excluded domains match whole labels only: the domain itself or any subdomain of it.
+        # str.endswith accepts a tuple, which checks every subdomain suffix in a single C call.
+        self._excluded_hosts = frozenset(domain.lower() for domain in self.excluded_domains)
+        self._excluded_suffixes = tuple("." + domain for domain in self._excluded_hosts)
         self.trafficking_terms = [
             '"human trafficking"',
             '"cyber trafficking"',
@@ -80,54 +292,107 @@ class TraffickingNewsSearch:
             "charged",
             "convicted",
         ]
+        # The query prefix depends only on the fields above, so assemble it once.
+        self._trafficking_part = "(" + " OR ".join(self.trafficking_terms) + ")"
+        self._evidence_part = "(" + " OR ".join(self.evidence_terms) + ")"
+        self._excluded_sites = " ".join(f"-site:{domain}" for domain in self.excluded_domains)
+        self._base_prefix = (
+            f'{self._trafficking_part} AND {self._evidence_part} AND ("news" OR "article") AND "South Africa" '
+            f'{self._excluded_sites}'
+        )
+        self._trafficking_prefix = f"{self._trafficking_part} {self._excluded_sites}"
 
-    def is_valid_news_domain(self, url: str) -> bool:
+    def is_valid_news_domain(self, url: str) -> Optional[str]:
         """
-        Returns True if the URL does not belong to an excluded domain.
+        Returns the URL's host (netloc without userinfo or port) if it does not belong to an
+        excluded domain, otherwise None.
+
+        This runs on the event loop thread, so it must stay pure string parsing (no DNS lookups).
         """
-        try:
-            domain = urlparse(url).netloc.lower()
-            # Exclude if any excluded domain appears in the URL's domain.
-            if any(excluded in domain for excluded in self.excluded_domains):
-                return False
-            return True
-        except Exception as e:
-            logger.error(f"Error checking domain validity for {url}: {e}")
-            return False
+        netloc = _netloc(url)
+        # Exclude if the URL's host is an excluded domain or one of its subdomains.
+        if not netloc or netloc in self._excluded_hosts or netloc.endswith(self._excluded_suffixes):
+            return None
+        return netloc
 
     def construct_query(self, start_date: str, end_date: str, include_evidence_terms: bool = True) -> str:
         """
         Construct a targeted search query.
         """
-        trafficking_part = f"({' OR '.join(self.trafficking_terms)})"
-        if include_evidence_terms:
-            evidence_part = f"({' OR '.join(self.evidence_terms)})"
-            base_query = f'{trafficking_part} AND {evidence_part} AND ("news" OR "article") AND "South Africa"'
-        else:
-            base_query = trafficking_part
-
-        excluded_sites = " ".join([f"-site:{domain}" for domain in self.excluded_domains])
-        final_query = f"{base_query} {excluded_sites} after:{start_date} before:{end_date}"
+        prefix = self._base_prefix if include_evidence_terms else self._trafficking_prefix
+        final_query = f"{prefix} after:{start_date} before:{end_date}"
         logger.debug(f"Constructed query: {final_query}")
         return final_query
 
-    def fetch_articles(self, query: str, max_results: int = 200) -> List[str]:
+    async def _get_with_retry(self, session: aiohttp.ClientSession, url: str, params: dict) -> str:
+        """
+        GET a page through the shared rate limiter, backing off exponentially on throttling.
+        """
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                async with self.rate_limiter:
+                    async with session.get(url, params=params) as response:
+                        response.raise_for_status()
+                        return await response.text()
+            except aiohttp.ClientResponseError as e:
+                if e.status not in RETRYABLE_STATUSES or attempt == MAX_RETRIES:
+                    raise
+                delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt)
+                logger.warning(f"HTTP {e.status} from {url}. Retrying in {delay:.1f} seconds...")
+                await asyncio.sleep(delay)
+
+    async def _fetch_page(self, session: aiohttp.ClientSession, query: str, start: int) -> List[str]:
         """
-        Fetch articles synchronously using google search.
+        Fetch a single page of Google results and return the raw result URLs.
         """
-        articles = []
+        params = {"q": query, "num": RESULTS_PER_PAGE, "start": start, "hl": "en"}
+        html = await self._get_with_retry(session, GOOGLE_SEARCH_URL, params)
+        return parse_result_links(html)
+
+    async def stream_articles(
+        self, query: str, session: aiohttp.ClientSession, max_results: int = 200
+    ) -> AsyncIterator[Tuple[str, str]]:
+        """
+        Yield (url, domain_name) pairs as each window of result pages arrives.
+
+        Pages are requested in concurrent windows; the stream stops at the first
+        empty page and never yields the same URL twice.
+        """
+        seen = set()
+        yielded = 0
+        starts = list(range(0, max_results, RESULTS_PER_PAGE))
         try:
-            for url in search(query, tld="com", lang="en", num=10, start=0, stop=max_results, pause=2):
-                if self.is_valid_news_domain(url):
-                    articles.append(url)
-            return articles
+            for i in range(0, len(starts), PAGE_BATCH_SIZE):
+                window = starts[i:i + PAGE_BATCH_SIZE]
+                pages = await asyncio.gather(*[self._fetch_page(session, query, start) for start in window])
+                for start, page_urls in zip(window, pages):
+                    if not page_urls:
+                        logger.info(f"No more results after start={start}.")
+                        return
+                    for url in page_urls:
+                        if url in seen:
+                            continue
+                        seen.add(url)
+                        netloc = self.is_valid_news_domain(url)
+                        if netloc:
+                            yield url, _TLD(netloc).domain
+                            yielded += 1
+                            if yielded >= max_results:
+                                return
         except Exception as e:
             logger.error(f"Error fetching articles: {e}")
-            return []
 
-    def get_recent_articles(self) -> List[str]:
+    async def fetch_articles(
+        self, query: str, session: aiohttp.ClientSession, max_results: int = 200
+    ) -> List[Tuple[str, str]]:
         """
-        Retrieve recent articles based on days_back.
+        Fetch all articles for a query into a list of (url, domain_name) pairs.
+        """
+        return [article async for article in self.stream_articles(query, session, max_results)]
+
+    def recent_query(self) -> str:
+        """
+        Build the search query covering the last days_back days.
         """
         end_date = datetime.now()
         start_date = end_date - timedelta(days=self.days_back)
@@ -136,77 +401,144 @@ class TraffickingNewsSearch:
             end_date=end_date.strftime("%Y-%m-%d")
         )
         logger.info(f"Searching for articles with query: {query}")
-        return self.fetch_articles(query)
+        return query
 
-    def save_to_neo4j(self, urls: List[str]) -> None:
+    def stream_recent_articles(self, session: aiohttp.ClientSession) -> AsyncIterator[Tuple[str, str]]:
         """
-        Save filtered articles to a Neo4j database.
+        Stream recent articles based on days_back.
         """
-        query = """
-            MERGE (url:Url {url: $url, source: 'google_miner'})
-            WITH url
-            MERGE (domain:Domain { name: $domain_name })
-            MERGE (url)-[:HAS_DOMAIN]->(domain)
+        return self.stream_articles(self.recent_query(), session)
+
+    async def get_recent_articles(self, session: aiohttp.ClientSession) -> List[Tuple[str, str]]:
+        """
+        Retrieve recent articles based on days_back.
         """
-        for url in urls:
-            domain_name = tldextract.extract(url).domain
-            parameters = {"domain_name": domain_name, "url": url}
-            execute_neo4j_query(query, parameters)
-            logger.info(f"Saved URL to Neo4j: {url}")
-
-    def save_to_csv(self, urls: List[str]) -> None:
-        """
-        Save filtered articles to a CSV file.
-        """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_dir = "output"
-        os.makedirs(output_dir, exist_ok=True)
-        file_name = f"{output_dir}/saved_urls_{self.search_name}_{timestamp}.csv"
-        with open(file_name, mode="w", newline="", encoding="utf-8") as csv_file:
-            fieldnames = ["url", "domain_name", "source"]
-            writer = csv.DictWriter(csv_file, fieldnames=fieldnames)
-            writer.writeheader()
-            for url in urls:
-                domain_name = tldextract.extract(url).domain
-                writer.writerow({
-                    "url": url,
-                    "domain_name": domain_name,
-                    "source": "google_miner"
-                })
-                logger.info(f"Saved URL to CSV: {url}")
-        logger.info(f"CSV file '{file_name}' created successfully.")
+        return await self.fetch_articles(self.recent_query(), session)
+
+    def save_to_neo4j(self, urls: List[Tuple[str, str]]) -> None:
+        """
+        Save filtered articles to a Neo4j database in UNWIND batches.
+        """
+        rows = [{"url": url, "domain": domain_name} for url, domain_name in urls]
+        for i in range(0, len(rows), NEO4J_BATCH_SIZE):
+            chunk = rows[i:i + NEO4J_BATCH_SIZE]
+            execute_neo4j_query(self._merge_cypher, {**self._merge_params_base, "rows": chunk})
+            logger.debug(f"Saved batch of {len(chunk)} URLs to Neo4j.")
+        logger.info(f"Saved {len(urls)} URLs to Neo4j.")
+
+    def save_to_csv(self, urls: Iterable[Tuple[str, str]]) -> None:
+        """
+        Append filtered articles to this search's rotating CSV files.
+
+        Blocking; call close_csv() once all articles have been saved.
+        """
+        self.csv_sink.write(urls)
+
+    def close_csv(self) -> None:
+        """
+        Finish this search's CSV output.
+        """
+        self.csv_sink.close()
+
+
+SinkItem = Tuple[TraffickingNewsSearch, List[Tuple[str, str]]]
+
+
+async def _sink_consumer(sink_queue: "asyncio.Queue[SinkItem]") -> None:
+    """
+    Drain article batches from the queue and write them on the default executor.
+
+    A single consumer writes every batch, so each searcher's CSV sink is only
+    ever touched by one thread at a time.
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        searcher, urls = await sink_queue.get()
+        try:
+            await loop.run_in_executor(None, searcher.save_to_csv, urls)
+            # To store results in Neo4j as well:
+            # await loop.run_in_executor(None, searcher.save_to_neo4j, urls)
+        except Exception as e:
+            logger.error(f"Error saving articles for {searcher.search_name}: {e}")
+        finally:
+            sink_queue.task_done()
+
+
+async def _run_search(
+    searcher: TraffickingNewsSearch,
+    session: aiohttp.ClientSession,
+    seen: set[str],
+    sink_queue: "asyncio.Queue[SinkItem]",
+) -> None:
+    """
+    Stream one configuration's search results onto the sink queue in batches.
+
+    URLs already produced by another configuration are skipped.
+    """
+    debug = logger.isEnabledFor(logging.DEBUG)
+    batch: List[Tuple[str, str]] = []
+    count = 0
+    async for url, domain_name in searcher.stream_recent_articles(session):
+        if url in seen:
+            continue
+        seen.add(url)
+        if debug:
+            logger.debug(f"Found article: {url}")
+        batch.append((url, domain_name))
+        count += 1
+        if len(batch) >= SINK_BATCH_SIZE:
+            await sink_queue.put((searcher, batch))
+            batch = []
+    if batch:
+        await sink_queue.put((searcher, batch))
+    logger.info(f"Retrieved {count} new articles in the past {searcher.days_back} day(s).")
+    if not count:
+        logger.info("No articles found for this configuration.")
 
 
 # ------------------------------
-# Main Entry Point (Synchronous)
+# Main Entry Point (Asynchronous)
 # ------------------------------
-def main() -> None:
+async def main() -> None:
     """
-    Execute searches and save articles.
+    Execute searches concurrently, saving articles in the background as they arrive.
     """
     parser = argparse.ArgumentParser()
     parser.add_argument("--days_back", type=int, help="Number of days to search back.", default=7)
     args = parser.parse_args()
+    config = load_config("search_config.json")
 
-    # Process each search configuration.
+    # One limiter for all searchers keeps the combined request rate bounded.
+    rate_limiter = RateLimiter()
+    searchers = []
     for search_config in config.get('run_configs', []):
-        # Use the days_back value provided from the command-line.
-        search_config['days_back'] = args.days_back
-
-        searcher = TraffickingNewsSearch(search_config)
-        articles = searcher.get_recent_articles()
+        # Use the days_back value provided from the command-line; copy so the cached config is untouched.
+        search_config = {**search_config, 'days_back': args.days_back}
+        searchers.append(TraffickingNewsSearch(search_config, rate_limiter))
 
-        logger.info(f"Retrieved {len(articles)} articles in the past {search_config['days_back']} day(s).")
-        if not articles:
-            logger.info("No articles found for this configuration.")
-            continue
+    # Host resolution goes through getaddrinfo on the loop's default executor; bound
+    # that pool and cache lookups so DNS never stalls the event loop.
+    loop = asyncio.get_running_loop()
+    loop.set_default_executor(ThreadPoolExecutor(max_workers=EXECUTOR_MAX_WORKERS))
+    connector = aiohttp.TCPConnector(resolver=aiohttp.ThreadedResolver(), ttl_dns_cache=DNS_CACHE_TTL)
+    timeout = aiohttp.ClientTimeout(total=30)
 
-        for article in articles:
-            logger.info(f"Found article: {article}")
-
-        # Uncomment the next line to store results in Neo4j:
-        # searcher.save_to_neo4j(articles)
-        searcher.save_to_csv(articles)
+    # Disk writes happen in a background consumer so fetching is never blocked on the sinks.
+    sink_queue: asyncio.Queue[SinkItem] = asyncio.Queue(maxsize=SINK_QUEUE_SIZE)
+    consumer = asyncio.create_task(_sink_consumer(sink_queue))
+    # URLs already saved by any configuration are skipped by the others.
+    seen: set[str] = set()
+    try:
+        async with aiohttp.ClientSession(
+            connector=connector, timeout=timeout, headers={"User-Agent": USER_AGENT}
+        ) as session:
+            await asyncio.gather(*[_run_search(s, session, seen, sink_queue) for s in searchers])
+        await sink_queue.join()
+    finally:
+        consumer.cancel()
+        await asyncio.gather(consumer, return_exceptions=True)
+        for searcher in searchers:
+            await loop.run_in_executor(None, searcher.close_csv)
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
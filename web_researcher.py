@@ -9,38 +9,37 @@ Developer: Christo Strydom
 """
 
 import os
-import json
+import functools
+import multiprocessing
 import math
-import random
 import time
+import asyncio
 import logging
-import pandas as pd
-import requests
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+import httpx
 import tldextract
-from typing import List, Optional, Any
-from bs4 import BeautifulSoup
-from readability import Document
+from typing import AsyncIterator, Dict, List, Optional, Any
 from newspaper import Article
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
 from selenium.common.exceptions import TimeoutException, WebDriverException
 
 from work_with_db import URLDatabase, DatabaseError
-from llama_index.core import Document as liDocument, VectorStoreIndex
-from llama_index.core.memory import ChatMemoryBuffer
-from llama_index.llms.openai import OpenAI
-from models import (
-    ConfirmResponse,
-    IncidentResponse,
-    SuspectFormResponse,
-    SuspectResponse,
-    VictimResponse,
-    VictimFormResponse
-)
+from openai import APIConnectionError, InternalServerError, OpenAI, RateLimitError
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential_jitter
+from models import FullExtractionResponse, NameConfirmationResponse
 from get_urls_from_csvs import get_unique_urls_from_csvs
+from article_parser import extract_from_page_source
+
+try:
+    from pybloom_live import ScalableBloomFilter
+except ImportError:  # pybloom_live is optional; get_new_urls falls back to an in-memory set.
+    ScalableBloomFilter = None
 
 # Configure Logging
 logging.basicConfig(
@@ -55,55 +54,64 @@ logger = logging.getLogger(__name__)
 API_KEY = os.getenv('GOOGLE_API_KEY')
 SEARCH_ENGINE_ID = os.getenv('GOOGLE_CSE_ID')
 MIN_TEXT_LENGTH = 100  # adjust as necessary
-if not API_KEY or not SEARCH_ENGINE_ID:
-    logger.critical("API_KEY and SEARCH_ENGINE_ID must be set as environment variables.")
-    exit(1)
+CONCURRENCY = 10  # maximum number of URLs processed at once
+DRIVER_POOL_SIZE = 3  # headless Chrome instances shared by all tasks
+CSE_URL = "https://www.googleapis.com/customsearch/v1"
+HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/90.0.4430.85 Safari/537.36"
+    )
+}
 
-# Prompts for chat engine processing
+# Extractor for the domain_name recorded in the urls table. process_url calls it on
+# the event loop for every URL, so it reads only tldextract's bundled suffix list
+# and never blocks on a network refresh or on-disk cache I/O.
+_extract = tldextract.TLDExtract(suffix_list_urls=(), cache_dir=None)
+
+# Prompts for LLM processing. The reply format is enforced by the Pydantic model
+# passed as the structured-output schema, so prompts only describe the content.
 SHORT_PROMPTS = {
-    "incident_prompt": (
-        "Assistant, please indicate if it can be said with certainty that this article is a factual report of an "
-        "actual incident of human trafficking or any closely associated crime."
-        "Return your answer in the following RAW JSON format with NO backticks OR code blocks:\n"
-        "{\n"
-        '  "answer": "yes" or "no",\n'
-        '  "evidence": ["incident1", "incident2", "incident3"] or null\n'
-        "}"
-    ),
-    "crime_prompt": (
-        "Assistant, please indicate if there is mention of crime in this article. If yes, provide the crime(s) by name. "
-        "Return your answer in the following JSON format:\n"
-        "{\n"
-        '  "answer": "yes" or "no",\n'
-        '  "evidence": ["crime1", "crime2", "crime3"] or null\n'
-        "}"
-    ),
-    "suspect_prompt": (
-        "Assistant, please indicate if there is mention of suspect(s) of a crime related to human trafficking in this article. "
-        "Suspects has to be natural persons that is, the NAME (firstname and/or secondname of suspect) of a person, not organizations or any other entities. Exclude cases involving allegations and cases involving "
-        "politicians or celebrities or ANY other sensational reports or reporting."
-        "If yes, provide the suspects(s) by name. EXCLUDE ALL other detail and ONLY provide the NAME (firstname and/or secondname of suspect) of the suspect(s)."
-        "Return your answer in the following RAW JSON format ONLY and NO backticks and with no code blocks:\n"
-        "{\n"
-        '  "answer": "yes" or "no",\n'
-        '  "evidence": ["firstname and/or secondname of suspect1", '
-        '"firstname and/or secondname of suspect2", "firstname and/or secondname of suspect3", ...] or null\n'
-        "}"
-    ),
-    "victim_prompt": (
-        "Assistant, the following is a list of named suspects in the accompanying article.  Please indicate if there is mention of victim(s) of a crime related to human trafficking in this article. "
-        "Victims have to be natural persons that is, the NAME (firstname and/or secondname of victim) of a person, not organizations or any other entities. Exclude cases involving allegations and cases involving "
-        "politicians or celebrities or ANY other sensational reports or reporting."
-        "If yes, provide the victim(s) by name. EXCLUDE ALL other detail and ONLY provide the NAME (firstname and/or secondname of victim) of the victim(s)."
-        "Return your answer in the following RAW JSON format ONLY with NO backticks and with NO code blocks:\n"
-        "{\n"
-        '  "answer": "yes" or "no",\n'
-        '  "evidence": ["firstname and/or secondname of victim1", '
-        '"firstname and/or secondname of victim2", "firstname and/or secondname of victim2", ...] or null\n'
-        "}"
+    "full_prompt": (
+        "Assistant, extract the incident, suspects and victims from this article as instructed."
     ),
 }
 
+# Static system prompt holding every instruction. It is identical for every URL
+# and is always sent first, ahead of the per-article content, so together with
+# the structured-output schema it forms a prefix shared by requests across
+# articles. OpenAI only caches prefixes of 1024 tokens or more; chat() logs the
+# cached token count so hits can be confirmed.
+SYSTEM_PROMPT = (
+    "You are a career forensic analyst with deep insight into crime and criminal activity, "
+    "especially human trafficking. Your express goal is to investigate online reports and extract pertinent factual detail.\n\n"
+    "For every article you are given, answer all of the following in a single pass.\n"
+    "1. Incident: indicate if it can be said with certainty that this article is a factual report of an "
+    'actual incident of human trafficking or any closely associated crime ("yes" or "no"), and list the incident(s).\n'
+    "2. Suspects: list every suspect of a crime related to human trafficking in this article.\n"
+    "3. Victims: list every victim of a crime related to human trafficking in this article.\n"
+    "Suspects and victims have to be natural persons, that is, the NAME (firstname and/or secondname) of a person, "
+    "not organizations or any other entities. Exclude cases involving allegations and cases involving "
+    "politicians or celebrities or ANY other sensational reports or reporting. "
+    "For each person, fill in every field from the text; use null for anything not stated and "
+    '"YYYY-MM-DD" for dates. If there is no incident, return empty suspect and victim lists.'
+)
+
+# --- HTTP Client ---
+
+def create_http_client() -> httpx.AsyncClient:
+    """
+    Builds the shared HTTP client. Its connection pool keeps sockets alive across
+    URLs, so repeat hosts skip the TCP and TLS handshakes, and failed connection
+    attempts are retried by the transport.
+    """
+    limits = httpx.Limits(max_connections=32, max_keepalive_connections=32)
+    transport = httpx.AsyncHTTPTransport(limits=limits, retries=3)
+    return httpx.AsyncClient(
+        transport=transport, headers=HEADERS, timeout=15, follow_redirects=True
+    )
+
 # --- Extraction Methods ---
 
 def extract_with_newspaper(url: str) -> str:
@@ -122,24 +130,28 @@ def extract_with_newspaper(url: str) -> str:
         logger.error(f"Error using newspaper3k for {url}: {e}")
     return ""
 
-def extract_with_readability(url: str) -> str:
-    """Fetch the page with requests and extract text using readability-lxml."""
+@functools.lru_cache(maxsize=1)
+def get_parse_pool() -> ProcessPoolExecutor:
+    """
+    Returns the process pool that runs readability parsing, which is CPU-bound and
+    would otherwise compete for the GIL with the event loop and Selenium threads.
+    Workers come from a forkserver rather than being forked from this process, whose
+    executor threads may hold locks. The server preloads only article_parser, and the
+    pool is built on first use so re-importing this module in a worker never creates one.
+    """
+    context = multiprocessing.get_context("forkserver")
+    context.set_forkserver_preload(["article_parser"])
+    return ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=context)
+
+async def extract_with_readability(url: str, client: httpx.AsyncClient) -> str:
+    """Fetch the page with httpx and extract text using readability-lxml."""
     try:
-        headers = {
-            "User-Agent": (
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/90.0.4430.85 Safari/537.36"
-            )
-        }
-        response = requests.get(url, headers=headers, timeout=10)
+        response = await client.get(url, timeout=10)
         if response.status_code != 200:
             logger.error(f"Requests returned status code {response.status_code} for {url}")
             return ""
-        doc = Document(response.text)
-        summary_html = doc.summary()
-        soup = BeautifulSoup(summary_html, "html.parser")
-        text = soup.get_text(separator="\n").strip()
+        loop = asyncio.get_running_loop()
+        text = await loop.run_in_executor(get_parse_pool(), extract_from_page_source, response.text)
         if len(text) >= MIN_TEXT_LENGTH:
             logger.info("Article extracted successfully using readability-lxml.")
             return text
@@ -149,26 +161,27 @@ def extract_with_readability(url: str) -> str:
         logger.error(f"Error using readability for {url}: {e}")
     return ""
 
-def extract_with_selenium(url: str) -> str:
-    """Render the page with Selenium and extract the main content."""
+def wait_for_main_content(driver, url: str) -> None:
+    """
+    Waits up to 10 s for an <article> or <main> element, returning as soon as
+    the main content is in the DOM rather than after a fixed delay.
+    """
     try:
-        chrome_options = Options()
-        chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument(
-            "user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/90.0.4430.85 Safari/537.36"
+        WebDriverWait(driver, 10).until(
+            EC.any_of(
+                EC.presence_of_element_located((By.TAG_NAME, "article")),
+                EC.presence_of_element_located((By.TAG_NAME, "main")),
+            )
         )
-        driver = webdriver.Chrome(options=chrome_options)
+    except TimeoutException:
+        logger.warning(f"No <article> or <main> element appeared for {url}; using the page as loaded.")
+
+def extract_with_selenium(driver, url: str) -> str:
+    """Render the page with a pooled Selenium driver and extract the main content."""
+    try:
         driver.get(url)
-        time.sleep(3)  # Allow time for dynamic content to load
-        html = driver.page_source
-        driver.quit()
-        doc = Document(html)
-        summary_html = doc.summary()
-        soup = BeautifulSoup(summary_html, "html.parser")
-        text = soup.get_text(separator="\n").strip()
+        wait_for_main_content(driver, url)
+        text = get_parse_pool().submit(extract_from_page_source, driver.page_source).result()
         if len(text) >= MIN_TEXT_LENGTH:
             logger.info("Article extracted successfully using Selenium with readability.")
             return text
@@ -178,41 +191,67 @@ def extract_with_selenium(url: str) -> str:
         logger.error(f"Error using Selenium for {url}: {e}")
     return ""
 
-def extract_main_text(url: str) -> str:
+async def extract_with_prefetched_html(url: str, html: str) -> str:
+    """Extract the main content from HTML already rendered by Selenium."""
+    try:
+        loop = asyncio.get_running_loop()
+        text = await loop.run_in_executor(get_parse_pool(), extract_from_page_source, html)
+        if len(text) >= MIN_TEXT_LENGTH:
+            logger.info("Article extracted successfully from the prefetched Selenium page.")
+            return text
+        else:
+            logger.warning("Prefetched page extraction returned insufficient text.")
+    except Exception as e:
+        logger.error(f"Error extracting prefetched page for {url}: {e}")
+    return ""
+
+async def extract_main_text(
+    url: str, client: httpx.AsyncClient, driver_pool: asyncio.Queue, prefetched_html: str = ""
+) -> str:
     """
     Extracts the main text from an article URL using multiple fallback methods.
-    1. Try newspaper3k.
-    2. Fall back to requests + readability-lxml.
-    3. Finally, use Selenium to render JavaScript.
+    1. Use the page already rendered by Selenium, if provided.
+    2. Try newspaper3k.
+    3. Fall back to httpx + readability-lxml.
+    4. Finally, if no rendered page was provided, render the page with Selenium.
+    The blocking newspaper3k and Selenium steps run on the default executor, and
+    readability parsing runs on the parse pool.
     """
     logger.info(f"Attempting to extract article text from {url}")
-    text = extract_with_newspaper(url)
+    loop = asyncio.get_running_loop()
+    if prefetched_html:
+        text = await extract_with_prefetched_html(url, prefetched_html)
+        if text:
+            return text
+    text = await loop.run_in_executor(None, extract_with_newspaper, url)
     if text:
         return text
-    text = extract_with_readability(url)
-    if text:
+    text = await extract_with_readability(url, client)
+    if text or prefetched_html:
+        # A second render would see the same JS-rendered page that already failed.
         return text
-    return extract_with_selenium(url)
+    async with checkout_driver(driver_pool) as driver:
+        return await loop.run_in_executor(None, extract_with_selenium, driver, url)
 
 # --- Google Search Functions (if needed externally) ---
 
-def google_search(query, api_key, cse_id, start, num=10):
+async def google_search(query, api_key, cse_id, start, client: httpx.AsyncClient, num=10):
     """
     Performs a Google Custom Search and returns the search results.
     """
-    service = build("customsearch", "v1", developerKey=api_key)
+    params = {"q": query, "cx": cse_id, "num": num, "start": start, "key": api_key}
     try:
-        res = service.cse().list(q=query, cx=cse_id, num=num, start=start).execute()
-        return res.get('items', [])
-    except HttpError as e:
-        error_content = e.content.decode('utf-8')
-        logger.error(f"HTTP Error {e.resp.status}: {error_content}")
+        response = await client.get(CSE_URL, params=params)
+        response.raise_for_status()
+        return response.json().get('items', [])
+    except httpx.HTTPStatusError as e:
+        logger.error(f"HTTP Error {e.response.status_code}: {e.response.text}")
         return []
     except Exception as e:
         logger.error(f"Unexpected error during Google Search API call: {e}")
         return []
 
-def fetch_all_results(query, api_key, cse_id, max_results=30):
+async def fetch_all_results(query, api_key, cse_id, client: httpx.AsyncClient, max_results=30):
     """
     Fetches all search results up to the specified maximum.
     """
@@ -222,12 +261,12 @@ def fetch_all_results(query, api_key, cse_id, max_results=30):
     for page in range(total_pages):
         start = 1 + page * num_per_page
         logger.info(f"Fetching page {page + 1} with start={start}")
-        page_results = google_search(query, api_key, cse_id, start, num=num_per_page)
+        page_results = await google_search(query, api_key, cse_id, start, client, num=num_per_page)
         if not page_results:
             logger.warning(f"No results returned for start={start}. Ending search.")
             break
         results.extend(page_results)
-        time.sleep(1)
+        await asyncio.sleep(1)
     return results[:max_results]
 
 # --- Selenium and URL Utilities ---
@@ -257,25 +296,17 @@ def initialize_selenium() -> Optional[webdriver.Chrome]:
         logger.error(f"Failed to initialize Selenium WebDriver: {e}")
         return None
 
-def is_url_accessible(url: str) -> bool:
-    """Simple check to determine if a URL is accessible via Selenium."""
-    chrome_options = Options()
-    chrome_options.add_argument("--headless")
-    chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument(
-        "user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-        "AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/90.0.4430.85 Safari/537.36"
-    )
+@asynccontextmanager
+async def checkout_driver(driver_pool: asyncio.Queue) -> AsyncIterator[webdriver.Chrome]:
+    """
+    Borrows a WebDriver from the pool for the duration of the block.
+    WebDriver is not thread-safe, so each driver is used by one task at a time.
+    """
+    driver = await driver_pool.get()
     try:
-        driver = webdriver.Chrome(options=chrome_options)
-        driver.get(url)
-        status = driver.title != ""
-        driver.quit()
-        return status
-    except Exception as e:
-        logger.error(f"Exception for URL {url}: {e}")
-        return False
+        yield driver
+    finally:
+        driver_pool.put_nowait(driver)
 
 def fetch_url_with_retries(driver, url, max_retries=3, retry_delay=5) -> bool:
     """Attempts to load a URL with retries."""
@@ -294,365 +325,268 @@ def fetch_url_with_retries(driver, url, max_retries=3, retry_delay=5) -> bool:
     logger.error(f"Failed to load URL after {max_retries} attempts: {url}")
     return False
 
-def get_new_urls(new_urls: List[str]) -> List[str]:
+def load_page(driver, url: str) -> Optional[str]:
     """
-    Returns URLs that are not already in the database.
+    Renders a URL once with Selenium and returns its page source, or None if the
+    page could not be loaded or has no title, i.e. is not accessible.
     """
-    db = URLDatabase()
-    df = pd.DataFrame(db.search_urls(limit=1000000))
-    db_urls = df['url'].tolist()
-    return list(set(new_urls) - set(db_urls))
-
-# --- Chat Engine Helpers ---
+    if not fetch_url_with_retries(driver, url):
+        return None
+    try:
+        if driver.title == "":
+            return None
+        wait_for_main_content(driver, url)
+        return driver.page_source
+    except Exception as e:
+        logger.error(f"Exception for URL {url}: {e}")
+        return None
 
-def get_validated_response(prompt_key: str, prompt_text: str, model_class: Any, chat_engine) -> Optional[Any]:
+def get_new_urls(new_urls: List[str], db: URLDatabase) -> List[str]:
     """
-    Sends a prompt to the chat engine and validates the JSON response.
+    Returns URLs that are not already in the database.
+    With pybloom_live installed, stored URLs are held in a Bloom filter rather than
+    a set, and only the candidates it reports as seen are checked against the
+    database, so false positives are never dropped.
     """
-    max_retries = 5
-    base_delay = 5
-    for attempt in range(max_retries):
-        try:
-            response = chat_engine.chat(prompt_text)
-            logger.info(f"Prompt '{prompt_key}' processed successfully.")
-            response_data = model_class.model_validate_json(response.response)
-            return response_data
-        except json.JSONDecodeError as e:
-            logger.error(f"JSON decoding failed for '{prompt_key}': {e}")
-            return None
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Request error for '{prompt_key}': {e}")
-        except Exception as e:
-            if "429 Too Many Requests" in str(e):
-                delay = base_delay * (2 ** attempt) + random.uniform(0, 1)
-                logger.warning(f"Rate limit hit. Retrying in {delay:.2f} seconds...")
-                time.sleep(delay)
-            else:
-                logger.error(f"Failed to parse response for '{prompt_key}': {e}")
-                return None
-    logger.error(f"Max retries reached for '{prompt_key}'. Skipping...")
-    return None
-
-def verify_incident(url: str, chat_engine):
+    candidates = list(dict.fromkeys(new_urls))
+    if ScalableBloomFilter is None:
+        stored = db.get_all_urls()
+        return [url for url in candidates if url not in stored]
+    bloom = ScalableBloomFilter(initial_capacity=1_000_000, error_rate=1e-4)
+    for url in db.iter_urls():
+        bloom.add(url)
+    stored = db.find_existing_urls([url for url in candidates if url in bloom])
+    return [url for url in candidates if url not in stored]
+
+# --- Chat Helpers ---
+
+LLM_MODEL = "o3-mini"
+# The SDK's own retries are disabled so chat()'s tenacity policy is the only retry layer.
+llm_client = OpenAI(timeout=120.0, max_retries=0)
+
+def article_messages(text: str) -> List[dict]:
     """
-    Verifies whether an article reports an actual incident.
+    Builds the conversation prefix for an article: the static system prompt
+    first, then the article itself.
     """
-    db = URLDatabase()
-    result = {"actual_incident": -2}
-    incidents = []
-    try:
-        prompt_key = "incident_prompt"
-        prompt_text = SHORT_PROMPTS[prompt_key]
-        response_data = get_validated_response(prompt_key, prompt_text, IncidentResponse, chat_engine)
-        if response_data is None:
-            logger.warning(f"No valid response for URL: {url}")
-            return result, incidents
-        response_answer = response_data.answer.lower()
-        if response_answer == "no":
-            logger.info(f"No incident detected for URL: {url}")
-            db.update_field(url, "actual_incident", 0)
-            result["actual_incident"] = 0
-            return result, incidents
-        if response_answer == "yes":
-            logger.info(f"Incident detected for URL: {url}")
-            db.update_field(url, "actual_incident", 1)
-            result["actual_incident"] = 1
-            incidents = response_data.evidence or []
-            return result, incidents
-        logger.warning(f"Unexpected response for URL: {url} - {response_data.answer}")
-        return result, incidents
-    except Exception as e:
-        logger.error(f"Error processing URL {url}: {e}")
-        return result, incidents
-
-def confirm_natural_name(name: str) -> bool:
+    return [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {"role": "user", "content": f"ARTICLE:\n{text}"},
+    ]
+
+@retry(
+    retry=retry_if_exception_type((RateLimitError, APIConnectionError, InternalServerError)),
+    wait=wait_exponential_jitter(initial=1, max=60),
+    stop=stop_after_attempt(5),
+    reraise=True,
+)
+def chat(messages: List[dict], prompt_text: str, model_class: Any) -> Optional[Any]:
     """
-    Confirm if the provided string qualifies as a natural person's name.
+    Sends prompt_text after the article messages and returns the reply parsed into
+    model_class. The schema is enforced server-side via structured outputs; None is
+    returned if the model refuses. Rate limits, connection failures, timeouts and
+    5xx errors are retried with jittered exponential backoff.
     """
-    try:
-        prompt_text = (
-            f"Assistant, please evaluate the following string: '{name}'. "
-            "Determine whether this string is used to identify a natural person. "
-            "Return your answer in the following RAW JSON format ONLY and WITHOUT any backticks or additional commentary:\n"
-            "{\"answer\": \"yes\" or \"no\"}"
-        )
-        resp = llm.complete(prompt_text)
-        response_data = ConfirmResponse.model_validate_json(resp.text)
-        return response_data is not None and response_data.answer.lower() == "yes"
-    except Exception as e:
-        logger.error(f"Failed to confirm natural name: {e}")
-    return False
+    completion = llm_client.beta.chat.completions.parse(
+        model=LLM_MODEL,
+        messages=messages + [{"role": "user", "content": prompt_text}],
+        response_format=model_class,
+    )
+    usage = completion.usage
+    details = usage.prompt_tokens_details if usage else None
+    if details is not None:
+        logger.debug(f"Prompt tokens: {usage.prompt_tokens}, cached: {details.cached_tokens}")
+    return completion.choices[0].message.parsed
 
-def upload_suspects(url: str, chat_engine):
+def get_validated_response(prompt_key: str, prompt_text: str, model_class: Any, messages: List[dict]) -> Optional[Any]:
     """
-    Uploads suspect information to the database.
+    Sends a prompt about the article and returns the structured response.
     """
-    db = URLDatabase()
     try:
-        prompt_key = "suspect_prompt"
-        prompt_text = SHORT_PROMPTS[prompt_key]
-        response_data = get_validated_response(prompt_key, prompt_text, SuspectResponse, chat_engine)
-        if response_data is None:
-            return
-        if response_data.answer.lower() == "yes":
-            url_id = db.get_url_id(url)
-            suspects = response_data.evidence or []
-            if not suspects:
-                logger.info(f"No suspects found for URL: {url}")
-                return
-            for suspect in suspects:
-                if confirm_natural_name(suspect):
-                    try:
-                        db.insert_suspect(url_id=url_id, suspect=suspect)
-                        logger.info(f"Suspect inserted with natural name: {suspect}")
-                    except DatabaseError as e:
-                        logger.warning(f"Failed to insert suspect {suspect} for URL ID {url_id}: {e}")
-                    try:
-                        populate_suspect_forms_table(url, suspect, chat_engine)
-                    except Exception as e:
-                        logger.error(f"Failed to populate suspect form for {suspect}: {e}")
-                else:
-                    logger.info(f"Skipping suspect {suspect} as it is not a natural person's name.")
-                time.sleep(random.uniform(1, 3))
+        response_data = chat(messages, prompt_text, model_class)
     except Exception as e:
-        logger.error(f"Failed to upload suspects: {e}")
+        logger.error(f"Failed to get response for '{prompt_key}': {e}")
+        return None
+    if response_data is None:
+        logger.error(f"Model refused prompt '{prompt_key}'.")
+        return None
+    logger.info(f"Prompt '{prompt_key}' processed successfully.")
+    return response_data
 
-def upload_victims(url: str, chat_engine):
+# Verdicts are cached by name, since the same people recur across articles.
+_NAME_CACHE: Dict[str, bool] = {}
+
+def confirm_natural_names(names: List[str]) -> Dict[str, bool]:
     """
-    Uploads victim information to the database.
+    Confirm which of the provided strings qualify as natural persons' names.
+    Names not already cached are checked together in a single prompt.
     """
-    db = URLDatabase()
-    try:
-        prompt_key = "victim_prompt"
-        prompt_text = SHORT_PROMPTS[prompt_key]
-        response_data = get_validated_response(prompt_key, prompt_text, VictimResponse, chat_engine)
-        if response_data is None:
-            return
-        if response_data.answer.lower() == "yes":
-            url_id = db.get_url_id(url)
-            victims = response_data.evidence or []
-            if not victims:
-                logger.info(f"No victims found for URL: {url}")
-                return
-            for victim in victims:
-                if confirm_natural_name(victim):
-                    try:
-                        db.insert_victim(url_id=url_id, victim=victim)
-                        logger.info(f"Victim inserted with natural name: {victim}")
-                    except DatabaseError as e:
-                        logger.warning(f"Failed to insert victim {victim} for URL ID {url_id}: {e}")
-                    try:
-                        populate_victim_forms_table(url, victim, chat_engine)
-                    except Exception as e:
-                        logger.error(f"Failed to populate victim form for {victim}: {e}")
-                else:
-                    logger.info(f"Skipping victim {victim} as it is not a natural person's name.")
-        else:
-            logger.info(f"No victim found for URL: {url}")
-    except Exception as e:
-        logger.error(f"Failed to upload victims: {e}")
+    pending = [name for name in dict.fromkeys(names) if name not in _NAME_CACHE]
+    if pending:
+        try:
+            listing = "\n".join(f"- {name}" for name in pending)
+            prompt_text = (
+                "Assistant, please evaluate each of the following strings and determine whether it is used "
+                "to identify a natural person. For every string, return its name exactly as given and set "
+                'answer to "yes" or "no".\n'
+                f"{listing}"
+            )
+            response_data = chat([], prompt_text, NameConfirmationResponse)
+            for check in response_data.names if response_data else []:
+                if check.name in pending:
+                    _NAME_CACHE[check.name] = check.answer.lower() == "yes"
+        except Exception as e:
+            logger.error(f"Failed to confirm natural names: {e}")
+    return {name: _NAME_CACHE.get(name, False) for name in names}
 
-def populate_victim_forms_table(url: str, victim: str, chat_engine) -> None:
+# --- URL Processing (Asynchronous) ---
+
+def analyse_article(url: str, text: str, result: dict, db: URLDatabase) -> None:
     """
-    Populate the victim_forms table with details extracted from the text.
+    Sends the extracted text to the LLM and stores the findings.
+    Blocking; called from process_url on the default executor.
     """
-    db = URLDatabase()
     try:
-        victim_form_prompt = (
-            f"Assistant, carefully extract the following details for the victim named {victim} from the text: "
-            "1. Gender, 2. Date of Birth, 3. Age, 4. Address Notes, 5. Phone number, 6. Nationality, "
-            "7. Occupation, 8. Victim Appearance, 9. Victim Vehicle Description, 10. Vehicle Plate #, "
-            "11. Where is the victim been trafficked to?, 12. What job has the victim been offered? "
-            "Return your answer in the following RAW JSON format ONLY and NO backticks or code blocks:\n"
-            '{"gender": "male" or "female" or null,\n'
-            '  "date_of_birth": "YYYY-MM-DD" or null,\n'
-            '  "age": "integer" or null,\n'
-            '  "address_notes": "text" or null,\n'
-            '  "phone_number": "text" or null,\n'
-            '  "nationality": "text" or null,\n'
-            '  "occupation": "text" or null,\n'
-            '  "appearance": "text" or null,\n'
-            '  "vehicle_description": "text" or null,\n'
-            '  "vehicle_plate_number": "text" or null,\n'
-            '  "destination": "text" or null,\n'
-            '  "job_offered": "text" or null\n'
-            "}"
+        messages = article_messages(text)
+        prompt_key = "full_prompt"
+        response_data = get_validated_response(
+            prompt_key, SHORT_PROMPTS[prompt_key], FullExtractionResponse, messages
         )
-        response_text = chat_engine.chat(victim_form_prompt)
-        response_json = json.loads(response_text.response)
-        response_json["name"] = victim
-        response_data = VictimFormResponse.model_validate(response_json)
-        logger.info(f"Extracted victim form data: {response_data}")
-        if response_data:
-            url_id = db.get_url_id(url)
-            victim_id = db.get_victim_id(url_id, victim)
-            if url_id is None:
-                logger.error(f"URL not found in database: {url}")
-                return
-            db.insert_victim_form(url_id, response_data, victim_id)
-            logger.info(f"Successfully inserted victim form for {victim}")
+        store_extraction(url, response_data, result, db)
     except Exception as e:
-        logger.error(f"Failed to populate victim_forms table for {victim} from URL '{url}': {e}")
+        logger.error(f"Error processing URL {url}: {e}")
 
-def populate_suspect_forms_table(url: str, suspect: str, chat_engine) -> None:
+def store_extraction(
+    url: str, response_data: Optional[FullExtractionResponse], result: dict, db: URLDatabase
+) -> None:
     """
-    Populate the suspect_forms table with details extracted from the text.
+    Records the URL with its incident verdict and, for actual incidents, the
+    incidents, suspects and victims (with their forms) from a single extraction.
     """
-    db = URLDatabase()
-    try:
-        suspect_form_prompt = (
-            f"Assistant, carefully extract the following details for {suspect} from the text: "
-            "1. Gender, 2. Date of Birth, 3. Age, 4. Address Notes, 5. Phone number, 6. Nationality, "
-            "7. Occupation, 8. Role, 9. Suspect Appearance, 10. Suspect Vehicle Description, 11. Vehicle Plate #, "
-            "12. What is evident of the suspect from the article, 13. Arrested status, 14. Arrest Date, "
-            "15. Crime(s) Person Charged With, 16. Willing PV names, 17. Suspect in police custody, "
-            "18. Suspect's current location, 19. Suspect's last known location, 20. Suspect's last known location date. "
-            "Return your answer in the following RAW JSON format ONLY and NO backticks or code blocks:\n"
-            '{"gender": "male" or "female" or null,\n'
-            '  "date_of_birth": "YYYY-MM-DD" or null,\n'
-            '  "age": "integer" or null,\n'
-            '  "address_notes": "text" or null,\n'
-            '  "phone_number": "text" or null,\n'
-            '  "nationality": "text" or null,\n'
-            '  "occupation": "text" or null,\n'
-            '  "role": "text" or null,\n'
-            '  "appearance": "text" or null,\n'
-            '  "vehicle_description": "text" or null,\n'
-            '  "vehicle_plate_number": "text" or null,\n'
-            '  "evidence": "text" or null,\n'
-            '  "arrested_status": "text" or null,\n'
-            '  "arrest_date": "YYYY-MM-DD" or null,\n'
-            '  "crimes_person_charged_with": "text" or null,\n'
-            '  "willing_pv_names": "text" or null,\n'
-            '  "suspect_in_police_custody": "text" or null,\n'
-            '  "suspect_current_location": "text" or null,\n'
-            '  "suspect_last_known_location": "text" or null,\n'
-            '  "suspect_last_known_location_date": "YYYY-MM-DD" or null\n'
-            "}"
-        )
-        response_text = chat_engine.chat(suspect_form_prompt)
-        response_json = json.loads(response_text.response)
-        response_json["name"] = suspect
-        response_data = SuspectFormResponse.model_validate(response_json)
-        logger.info(f"Extracted suspect form data: {response_data}")
-        if response_data:
-            url_id = db.get_url_id(url)
-            suspect_id = db.get_suspect_id(url_id, suspect)
-            if url_id is None:
-                logger.error(f"URL not found in database: {url}")
-                return
-            db.insert_suspect_form(url_id, response_data, suspect_id)
-            logger.info(f"Successfully inserted suspect form for {suspect}")
-    except Exception as e:
-        logger.error(f"Failed to populate suspect_forms table for {suspect} from URL '{url}': {e}")
+    if response_data is None:
+        logger.warning(f"No valid response for URL: {url}")
+        result["actual_incident"] = -2
+        db.insert_url(result)
+        return
+    answer = response_data.incident.answer.lower()
+    result["actual_incident"] = {"yes": 1, "no": 0}.get(answer, -2)
+    if result["actual_incident"] != 1:
+        logger.info(f"No incident detected for URL: {url}")
+        db.insert_url(result)
+        return
 
-# --- URL Processing (Synchronous) ---
+    logger.info(f"Incident detected for URL: {url}")
+    # Confirm names before opening the transaction so no LLM call holds the write lock.
+    confirmed = confirm_natural_names(
+        [suspect.name for suspect in response_data.suspects] + [victim.name for victim in response_data.victims]
+    )
+    with db.transaction():
+        db.insert_url(result)
+        url_id = db.get_url_id(url)
+        db.insert_incidents_many(url_id, response_data.incident.evidence or [])
+
+        for suspect in response_data.suspects:
+            if not confirmed[suspect.name]:
+                logger.info(f"Skipping suspect {suspect.name} as it is not a natural person's name.")
+                continue
+            try:
+                db.insert_suspect(url_id=url_id, suspect=suspect.name)
+                db.insert_suspect_form(url_id, suspect, db.get_suspect_id(url_id, suspect.name))
+                logger.info(f"Inserted suspect and form for: {suspect.name}")
+            except DatabaseError as e:
+                logger.warning(f"Failed to insert suspect {suspect.name} for URL ID {url_id}: {e}")
+
+        for victim in response_data.victims:
+            if not confirmed[victim.name]:
+                logger.info(f"Skipping victim {victim.name} as it is not a natural person's name.")
+                continue
+            try:
+                db.insert_victim(url_id=url_id, victim=victim.name)
+                db.insert_victim_form(url_id, victim, db.get_victim_id(url_id, victim.name))
+                logger.info(f"Inserted victim and form for: {victim.name}")
+            except DatabaseError as e:
+                logger.warning(f"Failed to insert victim {victim.name} for URL ID {url_id}: {e}")
+
+def _record(url: str, domain: str, content: str = "", incident: int = -1, accessible: int = 0) -> dict:
+    """Builds the urls-table record for a processed URL; defaults describe a failure."""
+    return {
+        "url": url,
+        "domain_name": domain,
+        "source": "google_search",
+        "content": content,
+        "actual_incident": incident,
+        "accessible": accessible,
+    }
 
-def process_url(url: str, db: URLDatabase, driver) -> None:
+async def process_url(
+    url: str, db: URLDatabase, driver_pool: asyncio.Queue, client: httpx.AsyncClient
+) -> None:
     """
     Processes a single URL:
-      - Checks accessibility
-      - Attempts to load and extract text
-      - Uses the chat engine to verify incidents and extract details
+      - Renders the page once, which also checks accessibility
+      - Extracts the text, starting from the rendered page
+      - Uses the LLM to verify incidents and extract details
       - Inserts results into the database
+    Blocking Selenium, LLM and database work runs on the default executor, using
+    drivers checked out of driver_pool.
     """
-    if not is_url_accessible(url):
+    loop = asyncio.get_running_loop()
+    domain_name = _extract(url).domain
+    # One render both checks accessibility and provides the page for extraction.
+    async with checkout_driver(driver_pool) as driver:
+        html = await loop.run_in_executor(None, load_page, driver, url)
+    if html is None:
         logger.warning(f"URL not accessible: {url}")
-        result = {
-            "url": url,
-            "domain_name": tldextract.extract(url).domain,
-            "source": "google_search",
-            "content": "",
-            "actual_incident": -1,
-            "accessible": 0
-        }
-        db.insert_url(result)
+        await loop.run_in_executor(None, db.insert_url, _record(url, domain_name))
         return
 
     logger.info(f"Processing URL: {url}")
-    domain_name = tldextract.extract(url).domain
-
-    if not fetch_url_with_retries(driver, url):
-        result = {
-            "url": url,
-            "domain_name": domain_name,
-            "source": "google_search",
-            "content": "",
-            "actual_incident": -1,
-            "accessible": 0
-        }
-        db.insert_url(result)
-        return
 
-    text = extract_main_text(url)
+    text = await extract_main_text(url, client, driver_pool, prefetched_html=html)
     if not text:
         logger.warning(f"No text extracted from URL: {url}")
-        result = {
-            "url": url,
-            "domain_name": domain_name,
-            "source": "google_search",
-            "content": "",
-            "actual_incident": -1,
-            "accessible": 0
-        }
-        db.insert_url(result)
+        await loop.run_in_executor(None, db.insert_url, _record(url, domain_name))
         return
 
-    result = {
-        "url": url,
-        "domain_name": domain_name,
-        "source": "google_search",
-        "content": text,
-        "actual_incident": -1,
-        "accessible": 1
-    }
-
-    try:
-        documents = [liDocument(text=text)]
-        index = VectorStoreIndex.from_documents(documents)
-        ChatMemoryBuffer.from_defaults(token_limit=3000).reset()
-        chat_engine = index.as_chat_engine(
-            chat_mode="context",
-            llm=OpenAI(temperature=0, model="o3-mini", request_timeout=120.0),
-            memory=ChatMemoryBuffer.from_defaults(token_limit=3000),
-            system_prompt=(
-                "You are a career forensic analyst with deep insight into crime and criminal activity, "
-                "especially human trafficking. Your express goal is to investigate online reports and extract pertinent factual detail."
-            )
-        )
-        incident_type, incidents = verify_incident(url, chat_engine)
-        result.update(incident_type)
-        db.insert_url(result)
-        url_id = db.get_url_id(url)
-        if result.get("actual_incident") == 1:
-            for incident in incidents:
-                db.insert_incident(url_id, incident)
-                logger.info(f"Inserted incident: {incident}")
-            upload_suspects(url, chat_engine)
-            upload_victims(url, chat_engine)
-    except Exception as e:
-        logger.error(f"Error processing URL {url}: {e}")
-
-    time.sleep(random.uniform(1, 3))
+    result = _record(url, domain_name, content=text, accessible=1)
+    await loop.run_in_executor(None, analyse_article, url, text, result, db)
 
 # --- Main Execution ---
 
-def main():
+async def main():
     db = URLDatabase()
     urls_from_files = get_unique_urls_from_csvs('ht_csv', 'url', 4, 1000)
-    urls_from_db = pd.DataFrame(db.search_urls(limit=1000000))['url'].tolist()
-    urls = list(set(urls_from_files) - set(urls_from_db))
+    urls = get_new_urls(urls_from_files, db)
     logger.info(f"Found {len(urls)} new URLs to process.")
-    driver = initialize_selenium()
-    if driver is None:
+    drivers = [driver for driver in (initialize_selenium() for _ in range(DRIVER_POOL_SIZE)) if driver]
+    if not drivers:
         logger.critical("Selenium WebDriver initialization failed. Exiting.")
         return
+    driver_pool: asyncio.Queue = asyncio.Queue()
+    for driver in drivers:
+        driver_pool.put_nowait(driver)
+
+    semaphore = asyncio.Semaphore(CONCURRENCY)
 
-    for url in urls:
-        process_url(url, db, driver)
+    async def bounded(url: str) -> None:
+        async with semaphore:
+            try:
+                await process_url(url, db, driver_pool, client)
+            except Exception as e:
+                logger.error(f"Unhandled error processing URL {url}: {e}")
 
-    driver.quit()
+    try:
+        async with create_http_client() as client:
+            await asyncio.gather(*[bounded(url) for url in urls])
+    finally:
+        for driver in drivers:
+            driver.quit()
+        get_parse_pool().shutdown()
     logger.info("Google Miner service completed successfully.")
 
 if __name__ == '__main__':
-    main()
+    # Checked here rather than at import, since parse pool workers re-import this module.
+    if not API_KEY or not SEARCH_ENGINE_ID:
+        logger.critical("API_KEY and SEARCH_ENGINE_ID must be set as environment variables.")
+        exit(1)
+    asyncio.run(main())
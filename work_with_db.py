@@ -2,11 +2,12 @@ import logging
 import logging.handlers  # <-- Ensure the logging.handlers submodule is imported.
 import os
 import sqlite3
+import threading
 from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Union, Optional, Iterator
+from typing import List, Dict, Any, Union, Optional, Iterator, Set
 
 from dotenv import load_dotenv
 from models import SuspectFormResponse, VictimFormResponse
@@ -57,6 +58,9 @@ class URLDatabase:
         # Ensure the parent directory for the database exists.
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
 
+        # Connection of the transaction open on each thread, if any.
+        self._local = threading.local()
+
         # Setup logging.
         self._setup_logging()
 
@@ -80,20 +84,65 @@ class URLDatabase:
             handler.setFormatter(formatter)
             self.logger.addHandler(handler)
 
+    def _open_connection(self) -> sqlite3.Connection:
+        """Open a new connection with foreign keys enabled."""
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("PRAGMA foreign_keys = ON;")
+        return conn
+
+    def _in_transaction(self) -> bool:
+        """Return True if the calling thread is inside a transaction() block."""
+        return getattr(self._local, "conn", None) is not None
+
     @contextmanager
     def _get_connection(self) -> Iterator[sqlite3.Connection]:
         """
         Context manager for database connections.
-        Ensures that foreign keys are enabled for each new connection.
+        Inside a transaction() block the thread's open connection is reused;
+        otherwise a new connection is opened and closed afterwards.
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = getattr(self._local, "conn", None)
+        owned = conn is None
         try:
-            conn.execute("PRAGMA foreign_keys = ON;")
+            if owned:
+                conn = self._open_connection()
             yield conn
         except sqlite3.Error as e:
             self.logger.error(f"Database connection error: {str(e)}")
             raise DatabaseError(f"Database connection error: {str(e)}")
         finally:
+            if owned and conn is not None:
+                conn.close()
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """
+        Run every query issued by this thread inside the block on one connection
+        and commit them together, rolling all of them back if the block raises.
+        Nested blocks join the outer transaction.
+
+        Raises:
+            DatabaseError: If the transaction cannot be started or committed.
+        """
+        if self._in_transaction():
+            yield
+            return
+        try:
+            conn = self._open_connection()
+            conn.execute("BEGIN")
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to begin transaction: {str(e)}")
+            raise DatabaseError(f"Failed to begin transaction: {str(e)}")
+        self._local.conn = conn
+        try:
+            yield
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            self.logger.warning("Transaction rolled back")
+            raise
+        finally:
+            self._local.conn = None
             conn.close()
 
     @contextmanager
@@ -112,7 +161,8 @@ class URLDatabase:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute(query, params)
-                conn.commit()
+                if not self._in_transaction():
+                    conn.commit()
                 yield cursor
         except sqlite3.Error as e:
             error_msg = f"Database query failed: {query} with params {params} - {str(e)}"
@@ -506,6 +556,57 @@ class URLDatabase:
         """
         return self.search_urls(domain=domain)
 
+    def iter_urls(self) -> Iterator[str]:
+        """
+        Yield every stored URL string without building full URL records.
+
+        Yields:
+            The URL of each row in the urls table.
+
+        Raises:
+            DatabaseError: If the query fails.
+        """
+        with self._execute_query("SELECT url FROM urls") as cursor:
+            for (url,) in cursor:
+                yield url
+
+    def get_all_urls(self) -> Set[str]:
+        """
+        Retrieve every stored URL as a set, for fast membership tests.
+
+        Returns:
+            A set of URL strings.
+
+        Raises:
+            DatabaseError: If the query fails.
+        """
+        with self._execute_query("SELECT url FROM urls") as cursor:
+            return {row[0] for row in cursor}
+
+    def find_existing_urls(self, urls: List[str], chunk_size: int = 500) -> Set[str]:
+        """
+        Return the subset of urls already stored, querying in chunks to stay
+        below SQLite's bound-parameter limit.
+
+        Args:
+            urls: Candidate URL strings.
+            chunk_size: Number of URLs bound per query.
+
+        Returns:
+            The URLs from urls that exist in the urls table.
+
+        Raises:
+            DatabaseError: If the query fails.
+        """
+        existing: Set[str] = set()
+        with self._get_connection() as conn:
+            for start in range(0, len(urls), chunk_size):
+                chunk = urls[start:start + chunk_size]
+                placeholders = ", ".join("?" * len(chunk))
+                cursor = conn.execute(f"SELECT url FROM urls WHERE url IN ({placeholders})", chunk)
+                existing.update(row[0] for row in cursor)
+        return existing
+
     def insert_incident(self, url_id: int, incident: str) -> None:
         """
         Insert an incident record.
@@ -521,6 +622,26 @@ class URLDatabase:
         with self._execute_query(query, (url_id, incident)):
             self.logger.info(f"Inserted incident for URL ID {url_id}")
 
+    def insert_incidents_many(self, url_id: int, incidents: List[str]) -> None:
+        """
+        Insert several incident records for one URL with a single executemany.
+
+        Args:
+            url_id: The associated URL record ID.
+            incidents: The incident details.
+
+        Raises:
+            DatabaseError: If insertion fails.
+        """
+        if not incidents:
+            return
+        query = "INSERT INTO incidents (url_id, incident) VALUES (?, ?)"
+        with self._get_connection() as conn:
+            conn.executemany(query, [(url_id, incident) for incident in incidents])
+            if not self._in_transaction():
+                conn.commit()
+        self.logger.info(f"Inserted {len(incidents)} incidents for URL ID {url_id}")
+
     def insert_suspect(self, url_id: int, suspect: str) -> None:
         """
         Insert a suspect record.